@@ -28,12 +28,13 @@
     console.log(`Klar: Total records: ${allRecords.length} (${addedRecords.length} user-added)`);
 
     // 5. Enrich records with user data
+    const starredIds = new Set(userData.starred);
     const enrichedRecords = allRecords.map(record => {
       const pocId = record['poc.id'];
       return {
         ...record,
         _note: userData.notes[pocId] || null,
-        _starred: userData.starred.includes(pocId),
+        _starred: starredIds.has(pocId),
         _isUserAdded: record._isUserAdded || false
       };
     });
@@ -43,6 +43,11 @@ const State = (function() {
   // Subscribers for state changes
   const subscribers = new Set();
 
+  // poc.id -> record index, rebuilt lazily when records change
+  let recordIndex = null;
+  let indexedRecords = null;
+  let indexedLength = 0;
+
   /**
    * Get current state (returns a shallow copy)
    */
@@ -146,84 +151,96 @@ const State = (function() {
    * Get filtered and sorted records
    */
   function getFilteredRecords() {
-    let records = [...state.records];
     const { filters, searchQuery, sort } = state;
 
-    // Apply search
-    if (searchQuery && searchQuery.trim()) {
-      const query = searchQuery.toLowerCase().trim();
-      records = records.filter(r => {
-        const name = `${r['poc.first_name'] || ''} ${r['poc.last_name'] || ''}`.toLowerCase();
-        const fundTitle = (r['fund.title'] || '').toLowerCase();
-        const description = (r['fund.description'] || '').toLowerCase();
-        return name.includes(query) || fundTitle.includes(query) || description.includes(query);
-      });
-    }
+    // Collect active predicates, then filter in a single pass.
+    // Cheap Set lookups go first so most rejections skip the string work.
+    const predicates = [];
 
-    // Apply filters
+    // Apply filters (Sets for O(1) membership checks per record)
     if (filters.fundType && filters.fundType.length > 0) {
-      records = records.filter(r => filters.fundType.includes(r['fund.type']));
+      const fundTypes = new Set(filters.fundType);
+      predicates.push(r => fundTypes.has(r['fund.type']));
     }
 
     if (filters.country && filters.country.length > 0) {
-      records = records.filter(r => filters.country.includes(r['fund.country']));
+      const countries = new Set(filters.country);
+      predicates.push(r => countries.has(r['fund.country']));
     }
 
-    if (filters.sector && filters.sector.length > 0) {
-      records = records.filter(r => {
-        const sectors = (r['fund.sectors'] || '').split(';').map(s => s.trim());
-        return filters.sector.some(f => sectors.includes(f));
-      });
+    if (filters.stage && filters.stage.length > 0) {
+      const stages = new Set(filters.stage);
+      predicates.push(r => stages.has(r['fund.preferred_stage']));
     }
 
-    if (filters.stage && filters.stage.length > 0) {
-      records = records.filter(r => filters.stage.includes(r['fund.preferred_stage']));
+    if (filters.hasEmail) {
+      predicates.push(r => r['poc.email'] && r['poc.email'].trim());
     }
 
-    if (filters.aumMin !== null) {
-      records = records.filter(r => {
+    if (filters.aumMin !== null || filters.aumMax !== null) {
+      const { aumMin, aumMax } = filters;
+      predicates.push(r => {
         const aum = parseFloat(r['fund.aum.value']);
-        return !isNaN(aum) && aum >= filters.aumMin;
+        if (isNaN(aum)) return false;
+        if (aumMin !== null && !(aum >= aumMin)) return false;
+        if (aumMax !== null && !(aum <= aumMax)) return false;
+        return true;
       });
     }
 
-    if (filters.aumMax !== null) {
-      records = records.filter(r => {
-        const aum = parseFloat(r['fund.aum.value']);
-        return !isNaN(aum) && aum <= filters.aumMax;
+    if (filters.sector && filters.sector.length > 0) {
+      const sectors = new Set(filters.sector);
+      predicates.push(r =>
+        (r['fund.sectors'] || '').split(';').some(s => sectors.has(s.trim()))
+      );
+    }
+
+    // Apply search
+    if (searchQuery && searchQuery.trim()) {
+      const query = searchQuery.toLowerCase().trim();
+      predicates.push(r => {
+        const name = `${r['poc.first_name'] || ''} ${r['poc.last_name'] || ''}`.toLowerCase();
+        const fundTitle = (r['fund.title'] || '').toLowerCase();
+        const description = (r['fund.description'] || '').toLowerCase();
+        return name.includes(query) || fundTitle.includes(query) || description.includes(query);
       });
     }
 
-    if (filters.hasEmail) {
-      records = records.filter(r => r['poc.email'] && r['poc.email'].trim());
+    // Filtering and sorting build new arrays, so no upfront copy is needed
+    let records = state.records;
+    if (predicates.length > 0) {
+      records = records.filter(r => predicates.every(test => test(r)));
     }
 
     // Apply sort
     if (sort.field) {
-      records.sort((a, b) => {
-        let aVal = a[sort.field];
-        let bVal = b[sort.field];
+      const field = sort.field;
+      const numeric = field.includes('aum') || field.includes('ticket');
+      const dir = sort.direction === 'asc' ? 1 : -1;
+
+      // Compute each sort key once per record, not once per comparison
+      const keyed = records.map(record => {
+        let value = record[field];
 
         // Handle null/undefined
-        if (aVal === null || aVal === undefined) aVal = '';
-        if (bVal === null || bVal === undefined) bVal = '';
+        if (value === null || value === undefined) value = '';
 
         // Numeric sort for AUM fields
-        if (sort.field.includes('aum') || sort.field.includes('ticket')) {
-          aVal = parseFloat(aVal) || 0;
-          bVal = parseFloat(bVal) || 0;
-        } else {
-          aVal = String(aVal).toLowerCase();
-          bVal = String(bVal).toLowerCase();
-        }
+        const key = numeric ? (parseFloat(value) || 0) : String(value).toLowerCase();
+        return { key, record };
+      });
 
-        if (aVal < bVal) return sort.direction === 'asc' ? -1 : 1;
-        if (aVal > bVal) return sort.direction === 'asc' ? 1 : -1;
+      keyed.sort((a, b) => {
+        if (a.key < b.key) return -dir;
+        if (a.key > b.key) return dir;
         return 0;
       });
+
+      records = keyed.map(item => item.record);
     }
 
-    return records;
+    // Never hand out the live state array
+    return records === state.records ? records.slice() : records;
   }
 
   /**
@@ -254,7 +271,21 @@ const State = (function() {
    * Get a single record by POC ID
    */
   function getRecord(pocId) {
-    return state.records.find(r => r['poc.id'] === pocId);
+    const records = state.records;
+
+    // Records are replaced on init and appended to in place by AddRecord
+    if (!recordIndex || indexedRecords !== records || indexedLength !== records.length) {
+      recordIndex = new Map();
+      records.forEach(r => {
+        if (!recordIndex.has(r['poc.id'])) {
+          recordIndex.set(r['poc.id'], r);
+        }
+      });
+      indexedRecords = records;
+      indexedLength = records.length;
+    }
+
+    return recordIndex.get(pocId);
   }
 
   /**
@@ -328,20 +359,32 @@ const State = (function() {
    */
   function getStats() {
     const records = state.records;
-    const uniqueFunds = new Set(records.map(r => r['fund.id']));
-    const uniqueCountries = new Set(records.filter(r => r['fund.country']).map(r => r['fund.country']));
+    const uniqueFunds = new Set();
+    const uniqueCountries = new Set();
 
     let totalAUM = 0;
     let recordsWithAUM = 0;
+    let withEmail = 0;
+
+    // Single pass, no intermediate arrays
     records.forEach(r => {
+      uniqueFunds.add(r['fund.id']);
+
+      if (r['fund.country']) {
+        uniqueCountries.add(r['fund.country']);
+      }
+
       const aum = parseFloat(r['fund.aum.value']);
       if (!isNaN(aum)) {
         totalAUM += aum;
         recordsWithAUM++;
       }
+
+      if (r['poc.email'] && r['poc.email'].trim()) {
+        withEmail++;
+      }
     });
 
-    const withEmail = records.filter(r => r['poc.email'] && r['poc.email'].trim()).length;
     const withNotes = Object.keys(state.userData?.notes || {}).length;
     const starred = state.userData?.starred?.length || 0;
     const savedLists = state.userData?.savedLists?.length || 0;
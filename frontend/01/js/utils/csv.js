@@ -3,6 +3,15 @@
  */
 
 const CSV = (function() {
+  // Patterns for parsing Python-style dicts in fund.portfolio_companies
+  const DICT_RE = /\{[^}]+\}/g;
+  const SINGLE_QUOTE_RE = /'/g;
+  const NONE_RE = /None/g;
+
+  // Values containing any of these must be quoted on export
+  const NEEDS_QUOTING_RE = /[",\n]/;
+  const QUOTE_RE = /"/g;
+
   /**
    * Load and parse CSV file
    * @param {string} url - Path to CSV file
@@ -60,8 +69,8 @@ const CSV = (function() {
         value = String(value);
 
         // Escape quotes and wrap in quotes if contains comma, quote, or newline
-        if (value.includes(',') || value.includes('"') || value.includes('\n')) {
-          value = '"' + value.replace(/"/g, '""') + '"';
+        if (NEEDS_QUOTING_RE.test(value)) {
+          value = '"' + value.replace(QUOTE_RE, '""') + '"';
         }
 
         return value;
@@ -124,16 +133,15 @@ const CSV = (function() {
 
     // Try to parse as JSON-like format
     // Format: {'name': 'X', 'website': 'Y', 'sector': 'Z', 'description': 'W'}; ...
-    const regex = /\{[^}]+\}/g;
-    const matches = str.match(regex);
+    const matches = str.match(DICT_RE);
 
     if (matches) {
       matches.forEach(match => {
         try {
           // Convert Python-style dict to JSON
           const jsonStr = match
-            .replace(/'/g, '"')
-            .replace(/None/g, 'null');
+            .replace(SINGLE_QUOTE_RE, '"')
+            .replace(NONE_RE, 'null');
           const company = JSON.parse(jsonStr);
           companies.push(company);
         } catch (e) {
@@ -255,20 +255,29 @@ const Format = (function() {
     'd2c': 'D2C'
   };
 
+  // Memoized display names (sectors are a small closed set, rendered repeatedly)
+  const sectorNameCache = new Map();
+
   function sectorName(sector) {
     if (!sector) return '';
 
+    const cached = sectorNameCache.get(sector);
+    if (cached !== undefined) return cached;
+
     // Check for special cases first
     const lower = sector.toLowerCase();
-    if (SECTOR_SPECIAL_CASES[lower]) {
-      return SECTOR_SPECIAL_CASES[lower];
-    }
+    let result = SECTOR_SPECIAL_CASES[lower];
 
     // Default: convert kebab-case to Title Case
-    return sector
-      .split('-')
-      .map(word => word.charAt(0).toUpperCase() + word.slice(1))
-      .join(' ');
+    if (!result) {
+      result = sector
+        .split('-')
+        .map(word => word.charAt(0).toUpperCase() + word.slice(1))
+        .join(' ');
+    }
+
+    sectorNameCache.set(sector, result);
+    return result;
   }
 
   // Public API